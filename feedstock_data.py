@@ -3,7 +3,7 @@
 Pure functions that build the canonical tool model from raw fetched data
 and render it into two artifacts:
 
-  - profile/README.md  (via render_readme)
+  - profile/README.md  (via render_readme / write_readme)
   - site/src/data/tools.json  (via render_tools_json)
 
 Both artifacts derive from the same model so they cannot silently diverge.
@@ -11,13 +11,16 @@ Both artifacts derive from the same model so they cannot silently diverge.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
 
 # ── Model construction ─────────────────────────────────────────────────────────
 
 
 def build_tool_model(
     feedstocks_data: dict,
-    feedstock_outputs: dict[str, set[str]],
+    feedstock_outputs: dict[str, Iterable[str]],
     pr_counts: dict[str, int | str],
 ) -> dict:
     """Build the canonical in-memory model from raw data.
@@ -26,8 +29,9 @@ def build_tool_model(
         feedstocks_data: the feedstocks.json mapping.  Values are either a
             list of feedstock names (flat category) or a dict of
             subcategory_name -> list of feedstock names (nested category).
-        feedstock_outputs: mapping of feedstock_name -> set of output names,
-            as returned by load_feedstock_outputs().
+        feedstock_outputs: mapping of feedstock_name -> output names, as
+            returned by _invert_feedstock_outputs() (already sorted there;
+            sorting again here is linear).
         pr_counts: mapping of feedstock_name -> open PR count (int) or "ERROR".
 
     Returns:
@@ -73,13 +77,13 @@ def build_tool_model(
 
 def _build_feedstock_entries(
     feedstock_names: list[str],
-    feedstock_outputs: dict[str, set[str]],
+    feedstock_outputs: dict[str, Iterable[str]],
     pr_counts: dict[str, int | str],
 ) -> list[dict]:
     """Build sorted feedstock entry dicts for a single category/subcategory."""
     entries = []
     for name in sorted(feedstock_names):
-        outputs = sorted(feedstock_outputs.get(name, set()))
+        outputs = sorted(feedstock_outputs.get(name, ()))
         entries.append(
             {
                 "name": name,
@@ -103,109 +107,120 @@ def render_tools_json(model: dict) -> dict:
 
 def render_readme(model: dict) -> str:
     """Render the model as the profile/README.md Markdown string."""
-    lines: list[str] = []
-    lines.append("# HEP Packaging Coordination")
-    lines.append("")
-    lines.append(
+    return "\n".join(iter_readme_lines(model))
+
+
+def write_readme(model: dict, fp: TextIO) -> None:
+    """Stream the README to *fp*; writes exactly what render_readme returns."""
+    lines = iter_readme_lines(model)
+    fp.write(next(lines))
+    for line in lines:
+        fp.write("\n")
+        fp.write(line)
+
+
+def iter_readme_lines(model: dict) -> Iterator[str]:
+    """Yield the profile/README.md Markdown one line at a time (without newlines)."""
+    yield "# HEP Packaging Coordination"
+    yield ""
+    yield (
         "A community project working to get as many cross-platform builds of "
         "HEP tools on conda-forge as possible."
     )
-    lines.append("""<div align="center">
+    yield """<div align="center">
   <a href="https://hep-packaging-coordination.github.io/.github/" style="background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block;">Homepage</a>
-</div>""")
-    lines.append("")
-    lines.append("## Tools distributed on conda-forge")
-    lines.append("")
+</div>"""
+    yield ""
+    yield "## Tools distributed on conda-forge"
+    yield ""
 
     for category in model["categories"]:
         if category["feedstocks"] is not None:
             # Flat category — emit a single ### section.
-            lines.extend(_render_section(category["name"], category["feedstocks"]))
+            yield from _render_section(category["name"], category["feedstocks"])
         else:
             # Nested category — flatten: emit each subcategory as its own ### section,
             # silently skipping the parent key name (mirrors existing update_readme.py
             # behaviour where "Experiment specific" is never emitted as a heading).
             for sub in category["subcategories"]:
-                lines.extend(_render_section(sub["name"], sub["feedstocks"]))
-
-    lines.append("## Adding new tools")
-    lines.append("")
-    lines.append("Contributions of new HEP tools are very welcome!")
-    lines.append("")
-    lines.append("To get a new tool listed:")
-    lines.append("1. Package and distribute your tool on conda-forge.")
-    lines.append(
+                yield from _render_section(sub["name"], sub["feedstocks"])
+
+    yield "## Adding new tools"
+    yield ""
+    yield "Contributions of new HEP tools are very welcome!"
+    yield ""
+    yield "To get a new tool listed:"
+    yield "1. Package and distribute your tool on conda-forge."
+    yield (
         "2. Open up an [Issue](https://github.com/hep-packaging-coordination/.github/issues)"
         ' with title "Add `<tool name>` to HEP Packaging Coordination"'
         " with a link to the tool's conda-forge feedstock."
     )
-    lines.append("")
-    return "\n".join(lines)
+    yield ""
 
 
-def _render_section(section_title: str, feedstocks: list[dict]) -> list[str]:
-    """Return Markdown lines for one ### section table."""
-    lines: list[str] = []
-    lines.append(f"### {section_title}")
-    lines.append("")
-    lines.append(
-        "| Name | Feedstock | Output | Downloads | Version | Platforms | Open PRs |"
-    )
-    lines.append("| ---| --- | --- | --- | --- | --- | --- |")
+def _render_section(section_title: str, feedstocks: list[dict]) -> Iterator[str]:
+    """Yield Markdown lines for one ### section table."""
+    yield f"### {section_title}"
+    yield ""
+    yield "| Name | Feedstock | Output | Downloads | Version | Platforms | Open PRs |"
+    yield "| ---| --- | --- | --- | --- | --- | --- |"
     for entry in feedstocks:
-        lines.extend(_render_feedstock_rows(entry))
-    lines.append("")
-    return lines
-
-
-def _render_feedstock_rows(entry: dict) -> list[str]:
-    """Return one or more table rows for a single feedstock entry."""
+        yield from _render_feedstock_rows(entry)
+    yield ""
+
+
+# Invariant URL prefixes shared by every row.
+_GITHUB = "https://github.com/conda-forge/"
+_ANACONDA = "https://anaconda.org/conda-forge/"
+_BADGE = "https://img.shields.io/badge/"
+_DL = "https://img.shields.io/conda/dn/conda-forge/"
+_VN = "https://img.shields.io/conda/vn/conda-forge/"
+_PN = "https://img.shields.io/conda/pn/conda-forge/"
+
+# One table row per output.  shields.io badge labels escape hyphens as '--',
+# so {label} is the output name with that escaping applied.
+_ROW_TEMPLATE = (
+    "| {name} | {feedstock_badge} | "
+    f"[![Conda Recipe]({_BADGE}recipe-{{label}}-green.svg)]({{feedstock_url}}) | "
+    f"[![Conda Downloads]({_DL}{{output}}.svg)]({_ANACONDA}{{output}}) | "
+    f"[![Conda Version]({_VN}{{output}}.svg)]({_ANACONDA}{{output}}) | "
+    f"[![Conda Platforms]({_PN}{{output}}.svg)]({_ANACONDA}{{output}}) | "
+    "{pr_count_link} |"
+)
+
+# The Feedstock column is only filled on a feedstock's first row.
+_FEEDSTOCK_BADGE_TEMPLATE = (
+    f"[![Conda Recipe]({_BADGE}feedstock-{{label}}-green.svg)]({{feedstock_url}})"
+)
+
+
+def _render_feedstock_rows(entry: dict) -> Iterator[str]:
+    """Yield one or more table rows for a single feedstock entry."""
     feedstock_name = entry["name"]
     outputs = entry["outputs"]
     pr_count = entry["pr_count"]
 
-    feedstock_url = f"https://github.com/conda-forge/{feedstock_name}-feedstock"
-    pr_page_url = f"{feedstock_url}/pulls"
-    pr_count_link = "" if pr_count == 0 else f"[{pr_count}]({pr_page_url})"
+    feedstock_url = _GITHUB + feedstock_name + "-feedstock"
+    pr_count_link = "" if pr_count == 0 else f"[{pr_count}]({feedstock_url}/pulls)"
+
+    # Feedstock with no known outputs: emit one row with blanks for badge columns.
+    if not outputs:
+        yield f"| {feedstock_name} |  |  |  |  |  | {pr_count_link} |"
+        return
 
-    rows: list[str] = []
     for i, output in enumerate(outputs):
-        anaconda_url = f"https://anaconda.org/conda-forge/{output}"
-        # shields.io badge labels escape hyphens as '--'
         label = output.replace("-", "--")
-
-        if i == 0:
-            feedstock_badge = (
-                f"[![Conda Recipe](https://img.shields.io/badge/feedstock-{label}-green.svg)]"
-                f"({feedstock_url})"
-            )
-        else:
-            feedstock_badge = ""
-
-        recipe_badge = (
-            f"[![Conda Recipe](https://img.shields.io/badge/recipe-{label}-green.svg)]"
-            f"({feedstock_url})"
+        feedstock_badge = (
+            _FEEDSTOCK_BADGE_TEMPLATE.format(label=label, feedstock_url=feedstock_url)
+            if i == 0
+            else ""
         )
-        downloads_badge = (
-            f"[![Conda Downloads](https://img.shields.io/conda/dn/conda-forge/{output}.svg)]"
-            f"({anaconda_url})"
+        yield _ROW_TEMPLATE.format(
+            name=feedstock_name,
+            feedstock_badge=feedstock_badge,
+            label=label,
+            output=output,
+            feedstock_url=feedstock_url,
+            pr_count_link=pr_count_link,
         )
-        version_badge = (
-            f"[![Conda Version](https://img.shields.io/conda/vn/conda-forge/{output}.svg)]"
-            f"({anaconda_url})"
-        )
-        platforms_badge = (
-            f"[![Conda Platforms](https://img.shields.io/conda/pn/conda-forge/{output}.svg)]"
-            f"({anaconda_url})"
-        )
-
-        rows.append(
-            f"| {feedstock_name} | {feedstock_badge} | {recipe_badge} | "
-            f"{downloads_badge} | {version_badge} | {platforms_badge} | {pr_count_link} |"
-        )
-
-    # Feedstock with no known outputs: emit one row with blanks for badge columns.
-    if not outputs:
-        rows.append(f"| {feedstock_name} |  |  |  |  |  | {pr_count_link} |")
-
-    return rows
@@ -7,9 +7,15 @@ Covers:
   - Consistency invariant: README and tools.json agree on every feedstock
 """
 
+import io
 import json
 
-from feedstock_data import build_tool_model, render_readme, render_tools_json
+from feedstock_data import (
+    build_tool_model,
+    render_readme,
+    render_tools_json,
+    write_readme,
+)
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
@@ -234,6 +240,14 @@ class TestRenderReadme:
         readme = self._readme()
         assert "## Adding new tools" in readme
 
+    def test_write_readme_streams_identical_content(self):
+        model = build_tool_model(
+            MINIMAL_FEEDSTOCKS, MINIMAL_FEEDSTOCK_OUTPUTS, MINIMAL_PR_COUNTS
+        )
+        buf = io.StringIO()
+        write_readme(model, buf)
+        assert buf.getvalue() == self._readme()
+
 
 # ── Consistency invariant ─────────────────────────────────────────────────────
 
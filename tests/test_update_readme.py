@@ -0,0 +1,350 @@
+"""Tests for the live-data fetchers in update_readme.py.
+
+Network access is stubbed with the ``responses`` library; no test talks to
+GitHub or conda-forge.
+"""
+
+import hashlib
+import json
+
+import pytest
+import responses
+
+import update_readme
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    """Keep the on-disk ETag cache out of the working tree."""
+    monkeypatch.setattr(update_readme, "CACHE_DIR", tmp_path / "gh")
+
+
+# ── GraphQL PR counts ─────────────────────────────────────────────────────────
+
+
+class TestGraphqlPrCounts:
+    def test_query_aliases_every_feedstock(self):
+        query, alias_to_feedstock = update_readme._build_pr_count_query(
+            ["root", "fastjet-contrib"]
+        )
+        assert sorted(alias_to_feedstock.values()) == ["fastjet-contrib", "root"]
+        for alias in alias_to_feedstock:
+            assert f"{alias}: repository(" in query
+        assert 'name: "fastjet-contrib-feedstock"' in query
+
+    def test_drafts_excluded_and_missing_repo_is_error(self):
+        _, alias_to_feedstock = update_readme._build_pr_count_query(["root", "gone"])
+        by_name = {f: a for a, f in alias_to_feedstock.items()}
+        data = {
+            by_name["root"]: {
+                "pullRequests": {
+                    "totalCount": 3,
+                    "nodes": [
+                        {"isDraft": False},
+                        {"isDraft": True},
+                        {"isDraft": False},
+                    ],
+                }
+            },
+            by_name["gone"]: None,
+        }
+        counts = update_readme._parse_pr_count_response(data, alias_to_feedstock)
+        assert counts == {"root": 2, "gone": "ERROR"}
+
+    @responses.activate
+    def test_token_posts_directly_to_graphql_endpoint(self, monkeypatch):
+        monkeypatch.setattr(
+            update_readme, "_AUTH_HEADERS", {"Authorization": "token dummy"}
+        )
+        feedstocks = [f"tool{i}" for i in range(update_readme.GRAPHQL_BATCH_SIZE + 1)]
+
+        def callback(request):
+            query = json.loads(request.body)["query"]
+            aliases = [
+                line.split(":")[0].strip()
+                for line in query.splitlines()
+                if "repository(" in line
+            ]
+            data = {
+                alias: {
+                    "pullRequests": {"totalCount": 1, "nodes": [{"isDraft": False}]}
+                }
+                for alias in aliases
+            }
+            return 200, {}, json.dumps({"data": data})
+
+        responses.add_callback(
+            responses.POST, update_readme.GRAPHQL_URL, callback=callback
+        )
+
+        counts = update_readme.fetch_all_pr_counts(feedstocks)
+
+        assert len(responses.calls) == 2
+        assert counts == {f: 1 for f in feedstocks}
+
+    @responses.activate
+    def test_failed_query_falls_back_to_rest(self, monkeypatch, capsys):
+        """A failure on the second batch keeps the first batch's counts and
+        sends only the remaining feedstocks to the search API."""
+        monkeypatch.setattr(
+            update_readme, "_AUTH_HEADERS", {"Authorization": "token dummy"}
+        )
+        monkeypatch.setattr(update_readme, "GRAPHQL_BATCH_SIZE", 1)
+        _, alias_to_feedstock = update_readme._build_pr_count_query(["pyhf"])
+        (pyhf_alias,) = alias_to_feedstock
+        responses.post(
+            update_readme.GRAPHQL_URL,
+            json={
+                "data": {
+                    pyhf_alias: {
+                        "pullRequests": {"totalCount": 5, "nodes": [{"isDraft": False}]}
+                    }
+                }
+            },
+        )
+        responses.post(
+            update_readme.GRAPHQL_URL,
+            json={
+                "data": None,
+                "errors": [{"type": "RATE_LIMITED", "message": "API rate limit"}],
+            },
+        )
+        responses.get(
+            update_readme.SEARCH_URL,
+            json={"total_count": 1, "items": [_pr_item("root")]},
+        )
+
+        counts = update_readme.fetch_all_pr_counts(["root", "pyhf"])
+
+        assert counts == {"pyhf": 5, "root": 1}
+        search_calls = [c for c in responses.calls if c.request.method == "GET"]
+        assert len(search_calls) == 1
+        assert "root-feedstock" in search_calls[0].request.url
+        assert "pyhf-feedstock" not in search_calls[0].request.url
+        assert "RATE_LIMITED" in capsys.readouterr().out
+
+    @responses.activate
+    def test_not_found_alias_is_error_without_fallback(self, monkeypatch):
+        monkeypatch.setattr(
+            update_readme, "_AUTH_HEADERS", {"Authorization": "token dummy"}
+        )
+        _, alias_to_feedstock = update_readme._build_pr_count_query(["gone", "root"])
+        by_name = {f: a for a, f in alias_to_feedstock.items()}
+        responses.post(
+            update_readme.GRAPHQL_URL,
+            json={
+                "data": {
+                    by_name["gone"]: None,
+                    by_name["root"]: {"pullRequests": {"totalCount": 0, "nodes": []}},
+                },
+                "errors": [{"type": "NOT_FOUND", "message": "Could not resolve"}],
+            },
+        )
+
+        counts = update_readme.fetch_all_pr_counts(["root", "gone"])
+
+        assert len(responses.calls) == 1
+        assert counts == {"gone": "ERROR", "root": 0}
+
+
+class TestFetchAllPrCounts:
+    def test_feedstock_listed_in_several_categories_collected_once(self):
+        names = update_readme._collect_feedstock_names(
+            {"Analysis": ["root", "pyhf"], "Experiment specific": {"CMS": ["root"]}}
+        )
+        assert names == {"root", "pyhf"}
+
+    def test_duplicate_feedstocks_fetched_once(self, monkeypatch):
+        seen = []
+
+        def fake_graphql(feedstocks):
+            seen.extend(feedstocks)
+            return {f: 0 for f in feedstocks}
+
+        monkeypatch.setattr(update_readme, "_fetch_pr_counts_graphql", fake_graphql)
+        counts = update_readme.fetch_all_pr_counts(["root", "pyhf", "root"])
+        assert seen == ["pyhf", "root"]
+        assert counts == {"pyhf": 0, "root": 0}
+
+
+# ── REST fallback ─────────────────────────────────────────────────────────────
+
+
+def _pr_item(feedstock):
+    return {
+        "repository_url": f"https://api.github.com/repos/conda-forge/{feedstock}-feedstock"
+    }
+
+
+class TestRestPrCounts:
+    def test_search_queries_respect_length_limit_and_cover_every_feedstock(self):
+        feedstocks = [f"tool{i}" for i in range(40)]
+        batches = list(update_readme._chunk_search_queries(feedstocks))
+        assert len(batches) > 1
+        for query, _ in batches:
+            assert len(query) <= update_readme.SEARCH_QUERY_MAX_LEN
+        assert [f for _, chunk in batches for f in chunk] == feedstocks
+
+    @responses.activate
+    def test_counts_tallied_per_repository(self):
+        responses.get(
+            update_readme.SEARCH_URL,
+            json={
+                "total_count": 3,
+                "items": [_pr_item("root"), _pr_item("root"), _pr_item("pyhf")],
+            },
+        )
+
+        counts = update_readme._fetch_pr_counts_rest(["root", "pyhf", "stanhf"])
+
+        assert len(responses.calls) == 1
+        assert "repo:conda-forge/stanhf-feedstock" in responses.calls[0].request.url
+        assert counts == {"root": 2, "pyhf": 1, "stanhf": 0}
+
+    @responses.activate
+    def test_paginates_until_total_count_reached(self):
+        responses.get(
+            update_readme.SEARCH_URL,
+            json={"total_count": 101, "items": [_pr_item("root")] * 100},
+        )
+        responses.get(
+            update_readme.SEARCH_URL,
+            json={"total_count": 101, "items": [_pr_item("root")]},
+        )
+
+        counts = update_readme._fetch_pr_counts_rest(["root"])
+
+        assert len(responses.calls) == 2
+        assert counts == {"root": 101}
+
+    @responses.activate
+    def test_waits_for_rate_limit_reset_then_retries(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(update_readme.time, "sleep", sleeps.append)
+        responses.get(
+            update_readme.SEARCH_URL,
+            status=403,
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"},
+        )
+        responses.get(
+            update_readme.SEARCH_URL,
+            json={"total_count": 1, "items": [_pr_item("root")]},
+        )
+
+        counts = update_readme._fetch_pr_counts_rest(["root"])
+
+        assert len(sleeps) == 1
+        assert counts == {"root": 1}
+
+    @responses.activate
+    def test_incomplete_results_mark_batch_as_error(self):
+        responses.get(
+            update_readme.SEARCH_URL,
+            json={
+                "total_count": 1,
+                "incomplete_results": True,
+                "items": [_pr_item("root")],
+            },
+        )
+        counts = update_readme._fetch_pr_counts_rest(["root", "pyhf"])
+        assert counts == {"root": "ERROR", "pyhf": "ERROR"}
+
+    @responses.activate
+    def test_failed_search_marks_batch_as_error(self):
+        responses.get(update_readme.SEARCH_URL, status=422)
+        counts = update_readme._fetch_pr_counts_rest(["root", "pyhf"])
+        assert counts == {"root": "ERROR", "pyhf": "ERROR"}
+
+
+# ── Feedstock-outputs inversion ───────────────────────────────────────────────
+
+
+class TestInvertFeedstockOutputs:
+    RAW = {
+        "root-binaries": ["root"],
+        "root": ["root"],
+        "numpy": ["numpy"],
+    }
+
+    def test_outputs_grouped_and_sorted_per_feedstock(self):
+        inverted = update_readme._invert_feedstock_outputs(self.RAW)
+        assert inverted == {"root": ["root", "root-binaries"], "numpy": ["numpy"]}
+
+    def test_unwanted_feedstocks_dropped(self):
+        inverted = update_readme._invert_feedstock_outputs(self.RAW, {"root"})
+        assert inverted == {"root": ["root", "root-binaries"]}
+
+
+# ── ETag cache ────────────────────────────────────────────────────────────────
+
+
+class TestCachedGet:
+    URL = "https://api.github.com/repos/conda-forge/root-feedstock/pulls"
+
+    @responses.activate
+    def test_not_modified_returns_cached_body(self):
+        responses.get(self.URL, json=[{"draft": False}], headers={"ETag": '"abc"'})
+        assert update_readme.cached_get(self.URL) == [{"draft": False}]
+
+        responses.replace(
+            responses.GET,
+            self.URL,
+            status=304,
+            match=[responses.matchers.header_matcher({"If-None-Match": '"abc"'})],
+        )
+        assert update_readme.cached_get(self.URL) == [{"draft": False}]
+
+    @responses.activate
+    def test_modified_response_replaces_cached_entry(self):
+        responses.get(self.URL, json=["old"], headers={"ETag": '"v1"'})
+        update_readme.cached_get(self.URL)
+
+        responses.replace(
+            responses.GET, self.URL, json=["new"], headers={"ETag": '"v2"'}
+        )
+        assert update_readme.cached_get(self.URL) == ["new"]
+
+        responses.replace(
+            responses.GET,
+            self.URL,
+            status=304,
+            match=[responses.matchers.header_matcher({"If-None-Match": '"v2"'})],
+        )
+        assert update_readme.cached_get(self.URL) == ["new"]
+        assert [p.suffix for p in update_readme.CACHE_DIR.iterdir()] == [".json"]
+
+    @responses.activate
+    def test_malformed_cache_entry_treated_as_miss(self):
+        update_readme.CACHE_DIR.mkdir(parents=True)
+        key = hashlib.sha1(self.URL.encode()).hexdigest()
+        (update_readme.CACHE_DIR / f"{key}.json").write_text('["not", "a", "dict"]')
+        responses.get(self.URL, json=["fresh"])
+
+        assert update_readme.cached_get(self.URL) == ["fresh"]
+        assert "If-None-Match" not in responses.calls[0].request.headers
+
+    @responses.activate
+    def test_unwritable_cache_dir_still_returns_body(self, tmp_path, monkeypatch):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        monkeypatch.setattr(update_readme, "CACHE_DIR", blocker / "gh")
+        responses.get(self.URL, json=["fresh"], headers={"ETag": '"v1"'})
+
+        assert update_readme.cached_get(self.URL) == ["fresh"]
+
+    @responses.activate
+    def test_failed_cache_write_leaves_no_temp_file(self, monkeypatch):
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(update_readme.os, "replace", fail)
+        responses.get(self.URL, json=["fresh"], headers={"ETag": '"v1"'})
+
+        assert update_readme.cached_get(self.URL) == ["fresh"]
+        assert list(update_readme.CACHE_DIR.iterdir()) == []
+
+    @responses.activate
+    def test_response_without_etag_is_not_cached(self):
+        responses.get(self.URL, json=[])
+        update_readme.cached_get(self.URL)
+        assert not update_readme.CACHE_DIR.exists()
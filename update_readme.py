@@ -6,14 +6,118 @@ and delegates model construction and rendering to feedstock_data.py so the
 two output files are always derived from the same in-memory model.
 """
 
+import contextlib
+import hashlib
 import json
 import os
 import subprocess
+import tempfile
+import time
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
-from feedstock_data import build_tool_model, render_readme, render_tools_json
+# orjson is an optional speed-up for parsing the multi-MB feedstock-outputs map.
+# It is deliberately not a pixi dependency: the parse happens once per run and
+# the stdlib fallback gives identical results, so `pixi run update` (used by
+# deploy.yml and site-ci.yml) stays on the smaller locked environment.  Only
+# the scheduled update-readme.yml job installs it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from feedstock_data import build_tool_model, render_tools_json, write_readme
+
+
+def _make_session():
+    """Create a pooled HTTP session with retries for transient GitHub errors.
+
+    Every request goes to api.github.com or raw.githubusercontent.com, so
+    keep-alive connections are reused instead of paying a TLS handshake per call.
+    """
+    session = requests.Session()
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry),
+    )
+    session.headers.update({"Accept": "application/vnd.github+json"})
+    return session
+
+
+SESSION = _make_session()
+
+# Resolved once at import; sent only to api.github.com, never to raw content hosts.
+_GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+_AUTH_HEADERS = {"Authorization": f"token {_GITHUB_TOKEN}"} if _GITHUB_TOKEN else {}
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Conditional-request cache: one JSON file per URL holding the last ETag and body.
+CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "gh"
+
+
+def cached_get(url, headers=None):
+    """GET *url* and return its decoded JSON body, revalidating via ETag.
+
+    When a previous response for *url* is cached on disk, its ETag is sent as
+    If-None-Match; a 304 reply (which costs no GitHub rate limit) returns the
+    cached body.  A 200 reply replaces the cache entry atomically.
+    Non-2xx responses other than 304 raise requests.HTTPError.
+    """
+    path = CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+    try:
+        cached = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        cached = None
+    if not (isinstance(cached, dict) and "body" in cached):
+        cached = None
+
+    request_headers = dict(headers or {})
+    if cached and cached.get("etag"):
+        request_headers["If-None-Match"] = cached["etag"]
+
+    response = SESSION.get(url, headers=request_headers)
+    if response.status_code == 304 and cached:
+        return cached["body"]
+    response.raise_for_status()
+    body = _json_loads(response.content)
+
+    etag = response.headers.get("ETag")
+    if etag:
+        _write_cache_entry(
+            path, {"etag": etag, "body": body, "fetched_at": time.time()}
+        )
+    return body
+
+
+def _write_cache_entry(path, entry):
+    """Atomically store *entry* at *path*; failures are logged, never raised.
+
+    The cache only saves rate limit, so an unwritable cache directory must not
+    cost the caller a response it already fetched.
+    """
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=CACHE_DIR, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            json.dump(entry, tmp)
+        os.replace(tmp_name, path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Could not write cache entry {path}: {e}")
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
 
 
 def load_feedstock_outputs():
@@ -23,146 +127,300 @@ def load_feedstock_outputs():
     """
     url = "https://raw.githubusercontent.com/conda-forge/feedstock-outputs/single-file/feedstock-outputs.json"
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return cached_get(url)
     except Exception as e:
         print(f"Error loading feedstock outputs: {e}")
         return {}
 
 
-def _fetch_pr_counts_graphql(feedstocks):
-    """Fetch open PR counts via gh CLI GraphQL in batches of 25.
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Repositories per GraphQL request.  Each alias asks for at most 100 PR nodes,
+# so 50 aliases stays well under GitHub's 500,000-node query limit.
+GRAPHQL_BATCH_SIZE = 50
+
 
-    Note: totalCount includes draft PRs (GraphQL pullRequests has no isDraft filter).
-    Returns a dict mapping feedstock name -> count, or None if gh CLI is unavailable/unauthenticated.
+def _build_pr_count_query(feedstocks):
+    """Build one aliased GraphQL query covering every feedstock in *feedstocks*.
+
+    Returns (query, alias_to_feedstock).
     """
 
-    # GraphQL aliases must match [_A-Za-z][_0-9A-Za-z]* — replace hyphens with underscores.
+    # GraphQL aliases must match [_A-Za-z][_0-9A-Za-z]* — replace hyphens with underscores
+    # and prefix with "r" so names starting with a digit stay valid.
     # conda-forge feedstock names use hyphens, not underscores, so collisions are not a concern.
     def to_alias(name):
-        return name.replace("-", "_")
+        return "r_" + name.replace("-", "_")
+
+    alias_to_feedstock = {to_alias(f): f for f in feedstocks}
 
+    query_parts = []
+    for alias, feedstock in alias_to_feedstock.items():
+        repo_name = f"{feedstock}-feedstock"
+        query_parts.append(
+            f'  {alias}: repository(owner: "conda-forge", name: "{repo_name}") {{\n'
+            f"    pullRequests(states: [OPEN], first: 100) {{\n"
+            f"      totalCount\n"
+            f"      nodes {{ isDraft }}\n"
+            f"    }}\n"
+            f"  }}"
+        )
+
+    query = "query {\n" + "\n".join(query_parts) + "\n}"
+    return query, alias_to_feedstock
+
+
+def _parse_pr_count_response(data, alias_to_feedstock):
+    """Turn the ``data`` object of a PR-count query into feedstock -> non-draft count.
+
+    Missing repositories come back as null aliases and are reported as "ERROR".
+    Drafts are only visible among the first 100 nodes; any PRs beyond that
+    are counted as non-draft.
+    """
     counts = {}
-    for i in range(0, len(feedstocks), 25):
-        chunk = feedstocks[i : i + 25]
-        alias_to_feedstock = {to_alias(f): f for f in chunk}
-
-        query_parts = []
-        for feedstock in chunk:
-            alias = to_alias(feedstock)
-            repo_name = f"{feedstock}-feedstock"
-            query_parts.append(
-                f'  {alias}: repository(owner: "conda-forge", name: "{repo_name}") {{\n'
-                f"    pullRequests(states: [OPEN]) {{\n"
-                f"      totalCount\n"
-                f"    }}\n"
-                f"  }}"
-            )
+    for alias, feedstock in alias_to_feedstock.items():
+        repo_data = data.get(alias)
+        if repo_data is None:
+            counts[feedstock] = "ERROR"
+            continue
+        pulls = repo_data["pullRequests"]
+        drafts = sum(1 for pr in pulls["nodes"] if pr.get("isDraft"))
+        counts[feedstock] = pulls["totalCount"] - drafts
+    return counts
+
+
+def _graphql_data(payload):
+    """Return the ``data`` object of a GraphQL response, raising on query failure.
+
+    GitHub answers HTTP 200 even when the whole query fails (rate limiting,
+    timeouts), with ``data: null`` and the reason in ``errors``.  NOT_FOUND
+    errors only null out the affected alias and are left to the parser.
+    """
+    errors = payload.get("errors") or []
+    for error in errors:
+        print(f"GraphQL error: {error.get('type', '')} {error.get('message', '')}")
+    data = payload.get("data")
+    if data is None or any(e.get("type") != "NOT_FOUND" for e in errors):
+        raise RuntimeError("GraphQL query failed")
+    return data
+
+
+def _run_graphql_http(query):
+    """POST *query* to the GitHub GraphQL endpoint; returns the ``data`` object."""
+    response = SESSION.post(
+        GRAPHQL_URL,
+        json={"query": query},
+        headers=_AUTH_HEADERS,
+    )
+    response.raise_for_status()
+    return _graphql_data(_json_loads(response.content))
+
+
+def _run_graphql_gh(query):
+    """Run *query* through ``gh api graphql``; returns the ``data`` object."""
+    result = subprocess.run(
+        ["gh", "api", "graphql", "-f", f"query={query}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return _graphql_data(json.loads(result.stdout))
+
+
+def _fetch_pr_counts_graphql(feedstocks):
+    """Fetch open non-draft PR counts via GraphQL in batches of GRAPHQL_BATCH_SIZE.
 
-        query = "query {\n" + "\n".join(query_parts) + "\n}"
+    Posts directly to the GraphQL endpoint when GITHUB_TOKEN is set, otherwise
+    goes through the gh CLI (which carries its own authentication).
+    Returns a dict mapping feedstock name -> count.  Stops at the first failed
+    batch, so feedstocks from that batch onwards are absent from the result.
+    """
+    counts = {}
+    for i in range(0, len(feedstocks), GRAPHQL_BATCH_SIZE):
+        chunk = feedstocks[i : i + GRAPHQL_BATCH_SIZE]
+        batch = i // GRAPHQL_BATCH_SIZE + 1
+        query, alias_to_feedstock = _build_pr_count_query(chunk)
 
         try:
-            result = subprocess.run(
-                ["gh", "api", "graphql", "-f", f"query={query}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            data = json.loads(result.stdout).get("data", {})
-            for alias, feedstock in alias_to_feedstock.items():
-                repo_data = data.get(alias)
-                if repo_data is None:
-                    counts[feedstock] = "ERROR"
-                else:
-                    counts[feedstock] = repo_data["pullRequests"]["totalCount"]
+            if _AUTH_HEADERS:
+                data = _run_graphql_http(query)
+            else:
+                data = _run_graphql_gh(query)
         except FileNotFoundError:
             print("gh CLI not found; falling back to REST API.")
-            return None
+            return counts
         except subprocess.CalledProcessError as e:
             print(
-                f"gh CLI error (batch {i // 25 + 1}): {e.stderr.strip()}; falling back to REST API."
+                f"gh CLI error (batch {batch}): {e.stderr.strip()}; falling back to REST API."
             )
-            return None
+            return counts
+        except Exception as e:
+            print(f"GraphQL error (batch {batch}): {e}; falling back to REST API.")
+            return counts
+
+        counts.update(_parse_pr_count_response(data, alias_to_feedstock))
 
     return counts
 
 
-def _fetch_pr_counts_rest(feedstocks):
-    """Fetch open non-draft PR counts via the GitHub REST API, one feedstock at a time.
+SEARCH_URL = "https://api.github.com/search/issues"
 
-    Uses GITHUB_TOKEN if set, otherwise makes unauthenticated requests.
-    Paginates through all open PRs to avoid missing any beyond the first page.
-    """
-    headers = {}
-    token = os.environ.get("GITHUB_TOKEN")
-    if token:
-        headers["Authorization"] = f"token {token}"
+# GitHub rejects search queries longer than 256 characters.
+SEARCH_QUERY_MAX_LEN = 256
+_SEARCH_BASE_QUERY = "is:pr+is:open+draft:false"
 
-    counts = {}
+# How often one search page may wait out a rate-limit reset before giving up.
+SEARCH_RATE_LIMIT_RETRIES = 3
+
+
+def _chunk_search_queries(feedstocks):
+    """Group feedstocks into as few ``repo:`` qualified search queries as fit.
+
+    Yields (query, chunk) pairs.
+    """
+    query, chunk = _SEARCH_BASE_QUERY, []
     for feedstock in feedstocks:
-        repo = f"conda-forge/{feedstock}-feedstock"
-        page, non_draft_count = 1, 0
+        qualifier = f"+repo:conda-forge/{feedstock}-feedstock"
+        if chunk and len(query) + len(qualifier) > SEARCH_QUERY_MAX_LEN:
+            yield query, chunk
+            query, chunk = _SEARCH_BASE_QUERY, []
+        query += qualifier
+        chunk.append(feedstock)
+    if chunk:
+        yield query, chunk
+
+
+def _rate_limit_delay(response):
+    """Seconds to wait before retrying a 403 rate-limited response, or None.
+
+    Honours Retry-After (secondary limits) and, once X-RateLimit-Remaining
+    hits zero, X-RateLimit-Reset (primary limits).  429s never get here:
+    SESSION's Retry already retries them and then raises RetryError.
+    """
+    if response is None or response.status_code != 403:
+        return None
+    headers = response.headers
+    if "Retry-After" in headers:
+        return float(headers["Retry-After"])
+    if headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+        return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time()) + 1
+    return None
+
+
+def _search_page(url):
+    """Fetch one search results page, sleeping through rate-limit resets."""
+    for attempt in range(SEARCH_RATE_LIMIT_RETRIES + 1):
+        try:
+            return cached_get(url, headers=_AUTH_HEADERS)
+        except requests.HTTPError as e:
+            delay = _rate_limit_delay(e.response)
+            if delay is None or attempt == SEARCH_RATE_LIMIT_RETRIES:
+                raise
+            print(f"Search rate limit reached; waiting {delay:.0f}s.")
+            time.sleep(delay)
+
+
+def _fetch_pr_counts_search(batch):
+    """Count open non-draft PRs per feedstock for one (query, chunk) search batch.
+
+    Pages through the matching PRs (100 per page) and tallies them by
+    repository, so one request usually covers every feedstock in the chunk.
+    """
+    query, chunk = batch
+    counts = dict.fromkeys(chunk, 0)
+    page, seen = 1, 0
+    try:
         while True:
-            url = f"https://api.github.com/repos/{repo}/pulls?state=open&per_page=100&page={page}"
-            try:
-                response = requests.get(url, headers=headers)
-                response.raise_for_status()
-                pulls = response.json()
-                if not pulls:
-                    break
-                non_draft_count += sum(1 for pr in pulls if not pr.get("draft", False))
-                page += 1
-            except Exception as e:
-                print(f"Error fetching PRs for {repo}: {e}")
-                non_draft_count = "ERROR"
-                break
-        counts[feedstock] = non_draft_count
+            url = f"{SEARCH_URL}?q={query}&per_page=100&page={page}"
+            result = _search_page(url)
+            if result.get("incomplete_results"):
+                # The search timed out server-side; a partial tally would undercount.
+                raise RuntimeError("search returned incomplete results")
+            for item in result["items"]:
+                repo = item["repository_url"].rsplit("/", 1)[-1]
+                feedstock = repo.removesuffix("-feedstock")
+                if feedstock in counts:
+                    counts[feedstock] += 1
+            seen += len(result["items"])
+            if len(result["items"]) < 100 or seen >= result["total_count"]:
+                return counts
+            page += 1
+    except Exception as e:
+        print(f"Error searching PRs for {', '.join(chunk)}: {e}")
+        return dict.fromkeys(chunk, "ERROR")
+
 
+def _fetch_pr_counts_rest(feedstocks):
+    """Fetch open non-draft PR counts via the GitHub REST search API.
+
+    Uses GITHUB_TOKEN if set, otherwise makes unauthenticated requests.
+    Feedstocks are batched into as few search queries as the query-length
+    limit allows, since search is limited to 30 requests/minute
+    (10 unauthenticated); pages that hit the limit wait for its reset.
+    """
+    counts = {}
+    for batch in _chunk_search_queries(feedstocks):
+        counts.update(_fetch_pr_counts_search(batch))
     return counts
 
 
 def fetch_all_pr_counts(feedstocks):
     """Fetch open PR counts for all feedstocks.
 
-    Tries gh CLI GraphQL (batched, authenticated) first; falls back to REST API with GITHUB_TOKEN.
+    Tries batched GraphQL (GITHUB_TOKEN or gh CLI) first; only feedstocks it
+    could not cover fall back to the more tightly rate-limited REST search API.
+    Each distinct feedstock is fetched once, however often it is listed.
     """
     if not feedstocks:
         return {}
 
-    feedstocks = list(feedstocks)
+    feedstocks = sorted(set(feedstocks))
     counts = _fetch_pr_counts_graphql(feedstocks)
-    if counts is None:
-        counts = _fetch_pr_counts_rest(feedstocks)
+    missing = [f for f in feedstocks if f not in counts]
+    if missing:
+        counts.update(_fetch_pr_counts_rest(missing))
     return counts
 
 
-def _invert_feedstock_outputs(raw_outputs: dict) -> dict[str, set[str]]:
-    """Invert the conda-forge output->feedstocks map to feedstock->outputs."""
-    by_feedstock: dict[str, set[str]] = {}
+def _invert_feedstock_outputs(raw_outputs: dict, wanted=None) -> dict[str, list[str]]:
+    """Invert the conda-forge output->feedstocks map to feedstock->sorted outputs.
+
+    If *wanted* is given, only those feedstocks are kept; the full map covers
+    every conda-forge feedstock, of which only a small fraction are listed here.
+    """
+    by_feedstock: dict[str, list[str]] = {}
     for output, feedstocks in raw_outputs.items():
         for feedstock in feedstocks:
-            by_feedstock.setdefault(feedstock, set()).add(output)
+            if wanted is None or feedstock in wanted:
+                by_feedstock.setdefault(feedstock, []).append(output)
+    for outputs in by_feedstock.values():
+        outputs.sort()
     return by_feedstock
 
 
+def _collect_feedstock_names(feedstocks_data: dict) -> set[str]:
+    """Return every distinct feedstock name in feedstocks.json, across all categories."""
+    names: set[str] = set()
+    for content in feedstocks_data.values():
+        if isinstance(content, list):
+            names.update(content)
+        elif isinstance(content, dict):
+            for tools in content.values():
+                names.update(tools)
+    return names
+
+
 def main():
     # Load local feedstocks.json.
     with open("feedstocks.json") as f:
         feedstocks_data = json.load(f)
 
     # Collect all feedstock names for a single batched PR-count fetch.
-    all_feedstocks: set[str] = set()
-    for content in feedstocks_data.values():
-        if isinstance(content, list):
-            all_feedstocks.update(content)
-        elif isinstance(content, dict):
-            for tools in content.values():
-                all_feedstocks.update(tools)
+    all_feedstocks = _collect_feedstock_names(feedstocks_data)
 
     # Fetch live data (network calls happen exactly once).
     raw_outputs = load_feedstock_outputs()
-    feedstock_outputs = _invert_feedstock_outputs(raw_outputs)
+    feedstock_outputs = _invert_feedstock_outputs(raw_outputs, all_feedstocks)
     pr_counts = fetch_all_pr_counts(all_feedstocks)
 
     # Build the shared model, then render both artifacts.
@@ -171,8 +429,8 @@ def main():
     script_dir = Path(__file__).resolve().parent
 
     readme_path = script_dir / "profile" / "README.md"
-    with open(readme_path, "w") as f:
-        f.write(render_readme(model))
+    with open(readme_path, "w", buffering=1 << 20) as f:
+        write_readme(model, f)
     print(f"README.md updated at {readme_path}")
 
     tools_json_path = script_dir / "site" / "src" / "data" / "tools.json"